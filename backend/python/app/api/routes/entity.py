@@ -3,13 +3,18 @@ import json
 import uuid
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 
+from app.api.middlewares.auth import authMiddleware
 from app.config.constants.arangodb import CollectionNames
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
-router = APIRouter(prefix="/api/v1/entity", tags=["Entity"])
+router = APIRouter(
+    prefix="/api/v1/entity",
+    tags=["Entity"],
+    dependencies=[Depends(authMiddleware)],
+)
 
 async def get_services(request: Request) -> Dict[str, Any]:
     """Get all required services from the container"""
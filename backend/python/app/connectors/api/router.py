@@ -29,6 +29,7 @@ from googleapiclient.http import MediaIoBaseDownload
 from jose import JWTError
 from pydantic import BaseModel, ValidationError
 
+from app.api.middlewares.auth import authMiddleware
 from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import (
     AccountType,
@@ -305,7 +306,7 @@ async def get_sharepoint_connector(request: Request) -> Optional[SharePointConne
         return None
 
 
-@router.delete("/api/v1/delete/record/{record_id}")
+@router.delete("/api/v1/delete/record/{record_id}", dependencies=[Depends(authMiddleware)])
 @inject
 async def handle_record_deletion(
     record_id: str, arango_service=Depends(Provide[ConnectorAppContainer.arango_service])
@@ -794,7 +795,7 @@ async def download_file(
         raise HTTPException(status_code=HttpStatusCode.INTERNAL_SERVER_ERROR.value, detail="Error downloading file")
 
 
-@router.get("/api/v1/stream/record/{record_id}", response_model=None)
+@router.get("/api/v1/stream/record/{record_id}", response_model=None, dependencies=[Depends(authMiddleware)])
 @inject
 async def stream_record(
     request: Request,
@@ -2074,7 +2075,7 @@ async def get_connector_stats_endpoint(
         raise HTTPException(status_code=500, detail=result["message"])
 
 
-@router.get("/api/v1/connectors/config/{app_name}")
+@router.get("/api/v1/connectors/config/{app_name}", dependencies=[Depends(authMiddleware)])
 async def get_connector_config(
     app_name: str,
     request: Request,
@@ -2155,7 +2156,7 @@ async def get_connectors(
     else:
         raise HTTPException(status_code=404, detail="No connectors found")
 
-@router.get("/api/v1/connectors/active")
+@router.get("/api/v1/connectors/active", dependencies=[Depends(authMiddleware)])
 async def get_active_connector(
     request: Request,
     arango_service: BaseArangoService = Depends(get_arango_service),
@@ -2168,7 +2169,7 @@ async def get_active_connector(
     return {"success": True, "connectors": result}
 
 
-@router.get("/api/v1/connectors/inactive")
+@router.get("/api/v1/connectors/inactive", dependencies=[Depends(authMiddleware)])
 async def get_inactive_connector(
     request: Request,
     arango_service: BaseArangoService = Depends(get_arango_service),
@@ -2180,7 +2181,7 @@ async def get_inactive_connector(
     result: List[Dict[str, Any]] = await connector_registry.get_inactive_connector()
     return {"success": True, "connectors": result}
 
-@router.get("/api/v1/connectors/schema/{app_name}")
+@router.get("/api/v1/connectors/schema/{app_name}", dependencies=[Depends(authMiddleware)])
 async def get_connector_schema(
     app_name: str,
     request: Request,
@@ -2214,7 +2215,7 @@ async def get_connector_schema(
     return {"success": True, "schema": schema}
 
 
-@router.get("/api/v1/connectors/{app_name}/oauth/authorize")
+@router.get("/api/v1/connectors/{app_name}/oauth/authorize", dependencies=[Depends(authMiddleware)])
 async def get_oauth_authorization_url(
     app_name: str,
     request: Request,
@@ -2767,7 +2768,7 @@ async def _get_fallback_filter_options(app_name: str) -> Dict[str, List[Dict[str
     return fallback_options.get(app_name.upper(), {})
 
 
-@router.get("/api/v1/connectors/{app_name}/filters")
+@router.get("/api/v1/connectors/{app_name}/filters", dependencies=[Depends(authMiddleware)])
 async def get_connector_filters(
     app_name: str,
     request: Request,
@@ -2847,7 +2848,7 @@ async def get_connector_filters(
         raise HTTPException(status_code=500, detail=f"Failed to get filter options: {str(e)}")
 
 
-@router.post("/api/v1/connectors/{app_name}/filters")
+@router.post("/api/v1/connectors/{app_name}/filters", dependencies=[Depends(authMiddleware)])
 async def save_connector_filters(
     app_name: str,
     request: Request,
@@ -2901,7 +2902,7 @@ async def save_connector_filters(
         logger.error(f"Error saving filter selections for {app_name}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to save filter selections: {str(e)}")
 
-@router.put("/api/v1/connectors/config/{app_name}")
+@router.put("/api/v1/connectors/config/{app_name}", dependencies=[Depends(authMiddleware)])
 async def update_connector_config(
     app_name: str,
     request: Request,
@@ -2997,7 +2998,7 @@ async def update_connector_config(
         )
 
 
-@router.post("/api/v1/connectors/toggle/{app_name}")
+@router.post("/api/v1/connectors/toggle/{app_name}", dependencies=[Depends(authMiddleware)])
 async def toggle_connector(
     app_name: str,
     request: Request,
@@ -66,7 +66,8 @@ class BaseConnector(ABC):
 
     @classmethod
     @abstractmethod
-    async def create_connector(cls, logger, data_store_provider: DataStoreProvider, config_service: ConfigurationService) -> "BaseConnector":
+    async def create_connector(cls, logger, data_store_provider: DataStoreProvider, config_service: ConfigurationService,
+        data_entities_processor: Optional[DataSourceEntitiesProcessor] = None) -> "BaseConnector":
         NotImplementedError("This method should be implemented by the subclass")
 
     def get_app(self) -> App:
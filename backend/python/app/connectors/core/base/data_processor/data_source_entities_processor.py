@@ -45,6 +45,7 @@ class DataSourceEntitiesProcessor:
         self.logger = logger
         self.data_store_provider: DataStoreProvider = data_store_provider
         self.config_service: ConfigurationService = config_service
+        self.messaging_producer: Optional[IMessagingProducer] = None
         self.org_id = ""
 
     async def initialize(self) -> None:
@@ -61,7 +62,10 @@ class DataSourceEntitiesProcessor:
             bootstrap_servers=bootstrap_servers,
             client_id=producer_config.get("client_id", "connectors"),
         )
-        self.messaging_producer: IMessagingProducer = MessagingFactory.create_producer(
+        # Re-initializing replaces the producer, so stop the previous one instead of leaking it
+        if self.messaging_producer is not None:
+            await self.messaging_producer.cleanup()
+        self.messaging_producer = MessagingFactory.create_producer(
             broker_type="kafka",
             logger=self.logger,
             config=kafka_producer_config,
@@ -4,7 +4,7 @@
 import asyncio
 import uuid
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import aiohttp
 from arango import ArangoClient
@@ -402,6 +402,38 @@ class BaseArangoService:
             self.logger.error(f"Failed to get organizations: {str(e)}")
             raise
 
+    async def iter_all_orgs(self, active: bool = True, batch_size: int = 100) -> AsyncIterator[Dict]:
+        """Yield organizations as the cursor fetches them, batch_size at a time.
+
+        Driver calls stay on the event loop like the rest of this service, since
+        python-arango's shared requests session is not thread-safe. The loop is
+        released after each batch so tasks started for earlier orgs get to run
+        before the next fetch.
+        """
+        query = f"""
+        FOR org IN {CollectionNames.ORGS.value}
+        FILTER @active == false || org.isActive == true
+        RETURN org
+        """
+
+        cursor = None
+        try:
+            cursor = self.db.aql.execute(query, bind_vars={"active": active}, batch_size=batch_size)
+            while True:
+                batch = cursor.batch()
+                while batch:
+                    yield batch.popleft()
+                if not cursor.has_more():
+                    break
+                await asyncio.sleep(0)
+                cursor.fetch()
+        except Exception as e:
+            self.logger.error(f"Failed to iterate organizations: {str(e)}")
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close(ignore_missing=True)
+
     async def get_document(self, document_key: str, collection: str) -> Optional[Dict]:
             """Get a document by its key"""
             try:
@@ -1,4 +1,3 @@
-import json
 from typing import Dict
 
 from aiokafka import AIOKafkaProducer
@@ -6,6 +5,7 @@ from aiokafka import AIOKafkaProducer
 from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import EventTypes
 from app.config.constants.service import config_node_constants
+from app.utils import fast_json
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
@@ -63,7 +63,7 @@ class KafkaService:
             await self._ensure_producer()
 
             # Convert event to JSON bytes for aiokafka
-            message_value = json.dumps(event).encode('utf-8')
+            message_value = fast_json.dumps(event)
 
             # Use recordId from payload as key if available, otherwise use timestamp
             record_id = event.get("payload", {}).get("recordId")
@@ -125,7 +125,7 @@ class KafkaService:
             }
 
             # Convert to JSON bytes for aiokafka
-            message_value = json.dumps(formatted_event).encode('utf-8')
+            message_value = fast_json.dumps(formatted_event)
             message_key = str(formatted_event["payload"]["recordId"]).encode('utf-8')
 
             # Send message and wait for delivery
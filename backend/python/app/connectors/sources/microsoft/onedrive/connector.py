@@ -1,6 +1,5 @@
 import asyncio
 import uuid
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from logging import Logger
 from typing import AsyncGenerator, Dict, List, Optional, Tuple
@@ -12,6 +11,7 @@ from fastapi.responses import StreamingResponse
 from msgraph import GraphServiceClient
 from msgraph.generated.models.drive_item import DriveItem
 from msgraph.generated.models.subscription import Subscription
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import Connectors, MimeTypes, OriginTypes
@@ -49,12 +49,15 @@ from app.models.permission import EntityType, Permission, PermissionType
 from app.utils.streaming import stream_content
 
 
-@dataclass
-class OneDriveCredentials:
-    tenant_id: str
-    client_id: str
-    client_secret: str
-    has_admin_consent: bool = False
+class OneDriveCredentials(BaseModel):
+    """Validated directly from the connector's camelCase auth config"""
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    tenant_id: str = Field(alias="tenantId", min_length=1)
+    client_id: str = Field(alias="clientId", min_length=1)
+    client_secret: str = Field(alias="clientSecret", min_length=1)
+    has_admin_consent: Optional[bool] = Field(default=False, alias="hasAdminConsent")
+
 
 @ConnectorBuilder("OneDrive")\
     .in_group("Microsoft 365")\
@@ -136,31 +139,25 @@ class OneDriveConnector(BaseConnector):
 
         self.rate_limiter = AsyncLimiter(50, 1)  # 50 requests per second
 
-    async def init(self) -> bool:
-        config = await self.config_service.get_config("/services/connectors/onedrive/config") or await self.config_service.get_config(f"/services/connectors/onedrive/config/{self.data_entities_processor.org_id}")
+    async def _get_onedrive_credentials(self, org_id: str) -> Optional[OneDriveCredentials]:
+        """Read the connector config for the org and validate its auth section"""
+        config = await self.config_service.get_config("/services/connectors/onedrive/config") or await self.config_service.get_config(f"/services/connectors/onedrive/config/{org_id}")
         if not config:
             self.logger.error("OneDrive config not found")
-            return False
+            return None
 
-        self.config = {"credentials": config}
-        if not config:
-            self.logger.error("OneDrive config not found")
-            raise ValueError("OneDrive config not found")
-        auth_config = config.get("auth", {})
-        tenant_id = auth_config.get("tenantId")
-        client_id = auth_config.get("clientId")
-        client_secret = auth_config.get("clientSecret")
-        if not all((tenant_id, client_id, client_secret)):
+        try:
+            credentials = OneDriveCredentials.model_validate(config.get("auth", {}))
+        except ValidationError:
             self.logger.error("Incomplete OneDrive config. Ensure tenantId, clientId, and clientSecret are configured.")
             raise ValueError("Incomplete OneDrive credentials. Ensure tenantId, clientId, and clientSecret are configured.")
+        return credentials
+
+    async def init(self) -> bool:
+        credentials = await self._get_onedrive_credentials(self.data_entities_processor.org_id)
+        if not credentials:
+            return False
 
-        has_admin_consent = auth_config.get("hasAdminConsent", False)
-        credentials = OneDriveCredentials(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=client_secret,
-            has_admin_consent=has_admin_consent,
-        )
          # Initialize MS Graph client
         credential = ClientSecretCredential(
             tenant_id=credentials.tenant_id,
@@ -810,9 +807,11 @@ class OneDriveConnector(BaseConnector):
 
     @classmethod
     async def create_connector(cls, logger: Logger,
-                               data_store_provider: DataStoreProvider, config_service: ConfigurationService) -> BaseConnector:
-        data_entities_processor = DataSourceEntitiesProcessor(logger, data_store_provider, config_service)
-        await data_entities_processor.initialize()
+                               data_store_provider: DataStoreProvider, config_service: ConfigurationService,
+                               data_entities_processor: Optional[DataSourceEntitiesProcessor] = None) -> BaseConnector:
+        if data_entities_processor is None:
+            data_entities_processor = DataSourceEntitiesProcessor(logger, data_store_provider, config_service)
+            await data_entities_processor.initialize()
 
         return OneDriveConnector(logger, data_entities_processor, data_store_provider, config_service)
 
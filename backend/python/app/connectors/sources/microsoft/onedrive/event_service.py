@@ -1,18 +1,22 @@
 """OneDrive Event Service for handling OneDrive-specific events"""
 
-import asyncio
 import logging
 from typing import Any, Dict
 
 from dependency_injector import providers
 
+from app.config.constants.arangodb import Connectors
 from app.connectors.core.base.data_store.arango_data_store import ArangoDataStore
 from app.connectors.core.base.event_service.event_service import BaseEventService
 from app.connectors.sources.google.common.arango_service import ArangoService
 from app.connectors.sources.microsoft.onedrive.connector import (
     OneDriveConnector,
 )
-from app.containers.connector import ConnectorAppContainer
+from app.containers.connector import (
+    ConnectorAppContainer,
+    get_or_init_data_entities_processor,
+)
+from app.utils.background_tasks import spawn_sync
 
 
 class OneDriveEventService(BaseEventService):
@@ -31,7 +35,7 @@ class OneDriveEventService(BaseEventService):
     async def process_event(self, event_type: str, payload: Dict[str, Any]) -> bool:
         """Handle connector-specific events - implementing abstract method"""
         try:
-            self.logger.info(f"Handling OneDrive connector event: {event_type}")
+            self.logger.info("Handling OneDrive connector event: %s", event_type)
 
             if event_type == "onedrive.init":
                 return await self._handle_onedrive_init(payload)
@@ -40,35 +44,35 @@ class OneDriveEventService(BaseEventService):
             elif event_type == "onedrive.resync":
                 return await self._handle_onedrive_start_sync(payload)
             else:
-                self.logger.error(f"Unknown OneDrive connector event type: {event_type}")
+                self.logger.error("Unknown OneDrive connector event type: %s", event_type)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error handling OneDrive connector event {event_type}: {e}", exc_info=True)
+            self.logger.error("Error handling OneDrive connector event %s: %s", event_type, e, exc_info=True)
             return False
 
     async def _handle_onedrive_init(self, payload: Dict[str, Any]) -> bool:
         """Initializes the OneDrive connector and its dependencies."""
-        try:
-            org_id = payload.get("orgId")
-            if not org_id:
-                self.logger.error("'orgId' is required in the payload for 'onedrive.init' event.")
-                return False
-
-            self.logger.info(f"Initializing OneDrive init sync service for org_id: {org_id}")
-            config_service = self.app_container.config_service()
-            arango_service = await self.app_container.arango_service()
-            data_store_provider = ArangoDataStore(self.logger, arango_service)
-            onedrive_connector = await OneDriveConnector.create_connector(self.logger, data_store_provider, config_service)
-            await onedrive_connector.init()
-            # Override the container's onedrive_connector provider with the initialized instance
-            self.app_container.onedrive_connector.override(providers.Object(onedrive_connector))
-            # Initialize directly since we can't use BackgroundTasks in Kafka consumer
-            return True
-        except Exception as e:
-            self.logger.error("Failed to initialize OneDrive connector for org_id %s: %s", org_id, e, exc_info=True)
+        org_id = payload.get("orgId")
+        if not org_id:
+            self.logger.error("'orgId' is required in the payload for 'onedrive.init' event.")
             return False
 
+        self.logger.info("Initializing OneDrive init sync service for org_id: %s", org_id)
+        config_service = self.app_container.config_service()
+        data_store_provider = ArangoDataStore(self.logger, self.arango_service)
+        data_entities_processor = await get_or_init_data_entities_processor(
+            self.app_container, org_id, Connectors.ONEDRIVE.value, self.logger, data_store_provider, config_service
+        )
+        onedrive_connector = await OneDriveConnector.create_connector(
+            self.logger, data_store_provider, config_service, data_entities_processor
+        )
+        await onedrive_connector.init()
+        # Override the container's onedrive_connector provider with the initialized instance
+        self.app_container.onedrive_connector.override(providers.Object(onedrive_connector))
+        # Initialize directly since we can't use BackgroundTasks in Kafka consumer
+        return True
+
     async def _handle_onedrive_start_sync(self, payload: Dict[str, Any]) -> bool:
         """Queue immediate start of the sync service"""
         try:
@@ -76,17 +80,13 @@ class OneDriveEventService(BaseEventService):
             if not org_id:
                 raise ValueError("orgId is required")
 
-            self.logger.info(f"Starting OneDrive sync service for org_id: {org_id}")
-            try:
-                onedrive_connector: OneDriveConnector = self.app_container.onedrive_connector()
-                if onedrive_connector:
-                    asyncio.create_task(onedrive_connector.run_sync())
-                    return True
-                else:
-                    self.logger.error("OneDrive connector not initialized")
-                    return False
-            except Exception as e:
-                self.logger.error(f"Failed to get OneDrive connector: {str(e)}")
+            self.logger.info("Starting OneDrive sync service for org_id: %s", org_id)
+            onedrive_connector: OneDriveConnector = self.app_container.onedrive_connector()
+            if onedrive_connector:
+                spawn_sync(onedrive_connector.run_sync())
+                return True
+            else:
+                self.logger.error("OneDrive connector not initialized")
                 return False
         except Exception as e:
             self.logger.error("Failed to queue OneDrive sync service start: %s", str(e))
@@ -19,6 +19,7 @@ from msgraph.generated.models.list_item import ListItem
 from msgraph.generated.models.site import Site
 from msgraph.generated.models.site_page import SitePage
 from msgraph.generated.models.subscription import Subscription
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import (
@@ -77,13 +78,15 @@ class SharePointRecordType(Enum):
     FILE = "FILE"
 
 
-@dataclass
-class SharePointCredentials:
-    tenant_id: str
-    client_id: str
-    client_secret: str
-    sharepoint_domain: str
-    has_admin_consent: bool = False
+class SharePointCredentials(BaseModel):
+    """Validated directly from the connector's camelCase auth config"""
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+
+    tenant_id: str = Field(alias="tenantId", min_length=1)
+    client_id: str = Field(alias="clientId", min_length=1)
+    client_secret: str = Field(alias="clientSecret", min_length=1)
+    sharepoint_domain: str = Field(alias="sharepointDomain", min_length=1)
+    has_admin_consent: Optional[bool] = Field(default=False, alias="hasAdminConsent")
     root_site_url: Optional[str] = None  # e.g., "contoso.sharepoint.com"
     enable_subsite_discovery: bool = True  # Whether to attempt subsite discovery
 
@@ -215,9 +218,10 @@ class SharePointConnector(BaseConnector):
             'errors_encountered': 0
         }
 
-    async def init(self) -> None:
+    async def _get_sharepoint_credentials(self, org_id: str) -> SharePointCredentials:
+        """Read the connector config for the org and validate its auth section"""
         config = await self.config_service.get_config("/services/connectors/sharepointonline/config") or \
-                            await self.config_service.get_config(f"/services/connectors/sharepointonline/config/{self.data_entities_processor.org_id}")
+                            await self.config_service.get_config(f"/services/connectors/sharepointonline/config/{org_id}")
         if not config:
             self.logger.error("❌ SharePoint Online credentials not found")
             raise ValueError("SharePoint Online credentials not found")
@@ -225,22 +229,15 @@ class SharePointConnector(BaseConnector):
         if not credentials_config:
             self.logger.error("❌ SharePoint Online credentials not found")
             raise ValueError("SharePoint Online credentials not found")
-        tenant_id = credentials_config.get("tenantId")
-        client_id = credentials_config.get("clientId")
-        client_secret = credentials_config.get("clientSecret")
-        sharepoint_domain = credentials_config.get("sharepointDomain")
-
-        if not all((tenant_id, client_id, client_secret, sharepoint_domain)):
+        try:
+            credentials = SharePointCredentials.model_validate(credentials_config)
+        except ValidationError:
             self.logger.error("❌ Incomplete SharePoint Online credentials. Ensure tenantId, clientId, and clientSecret are configured.")
             raise ValueError("Incomplete SharePoint Online credentials. Ensure tenantId, clientId, and clientSecret are configured.")
-        has_admin_consent = credentials_config.get("hasAdminConsent", False)
-        credentials = SharePointCredentials(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=client_secret,
-            sharepoint_domain=sharepoint_domain,
-            has_admin_consent=has_admin_consent,
-        )
+        return credentials
+
+    async def init(self) -> None:
+        credentials = await self._get_sharepoint_credentials(self.data_entities_processor.org_id)
         credential = ClientSecretCredential(
                 tenant_id=credentials.tenant_id,
                 client_id=credentials.client_id,
@@ -2231,9 +2228,11 @@ class SharePointConnector(BaseConnector):
 
     @classmethod
     async def create_connector(cls, logger: Logger,
-        data_store_provider: DataStoreProvider, config_service: ConfigurationService) -> BaseConnector:
-        data_entities_processor = DataSourceEntitiesProcessor(logger, data_store_provider, config_service)
-        await data_entities_processor.initialize()
+        data_store_provider: DataStoreProvider, config_service: ConfigurationService,
+        data_entities_processor: Optional[DataSourceEntitiesProcessor] = None) -> BaseConnector:
+        if data_entities_processor is None:
+            data_entities_processor = DataSourceEntitiesProcessor(logger, data_store_provider, config_service)
+            await data_entities_processor.initialize()
 
         return SharePointConnector(logger, data_entities_processor, data_store_provider, config_service)
 
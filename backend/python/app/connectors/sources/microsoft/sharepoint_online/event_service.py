@@ -1,18 +1,22 @@
 """OneDrive Event Service for handling OneDrive-specific events"""
 
-import asyncio
 import logging
 from typing import Any, Dict
 
 from dependency_injector import providers
 
+from app.config.constants.arangodb import Connectors
 from app.connectors.core.base.data_store.arango_data_store import ArangoDataStore
 from app.connectors.core.base.event_service.event_service import BaseEventService
 from app.connectors.services.base_arango_service import BaseArangoService
 from app.connectors.sources.microsoft.sharepoint_online.connector import (
     SharePointConnector,
 )
-from app.containers.connector import ConnectorAppContainer
+from app.containers.connector import (
+    ConnectorAppContainer,
+    get_or_init_data_entities_processor,
+)
+from app.utils.background_tasks import spawn_sync
 
 
 class SharePointOnlineEventService(BaseEventService):
@@ -31,7 +35,7 @@ class SharePointOnlineEventService(BaseEventService):
     async def process_event(self, event_type: str, payload: Dict[str, Any]) -> bool:
         """Handle connector-specific events - implementing abstract method"""
         try:
-            self.logger.info(f"Handling SharePoint Online connector event: {event_type}")
+            self.logger.info("Handling SharePoint Online connector event: %s", event_type)
 
             if event_type == "sharepointonline.init":
                 return await self._handle_sharepoint_init(payload)
@@ -40,36 +44,35 @@ class SharePointOnlineEventService(BaseEventService):
             elif event_type.lower() == "sharepointonline.resync":
                 return await self._handle_sharepoint_start_sync(payload)
             else:
-                self.logger.error(f"Unknown sharepoint online connector event type: {event_type}")
+                self.logger.error("Unknown sharepoint online connector event type: %s", event_type)
                 return False
 
         except Exception as e:
-            self.logger.error(f"Error handling SharePoint Online connector event {event_type}: {e}", exc_info=True)
+            self.logger.error("Error handling SharePoint Online connector event %s: %s", event_type, e, exc_info=True)
             return False
 
     async def _handle_sharepoint_init(self, payload: Dict[str, Any]) -> bool:
         """Initializes the SharePoint Online connector and its dependencies."""
-        try:
-            org_id = payload.get("orgId")
-            if not org_id:
-                self.logger.error("'orgId' is required in the payload for 'sharepointonline.init' event.")
-                return False
-
-            self.logger.info(f"Initializing SharePoint Online init sync service for org_id: {org_id}")
-            config_service = self.app_container.config_service()
-            arango_service = await self.app_container.arango_service()
-            data_store_provider = ArangoDataStore(self.logger, arango_service)
-            sharepoint_connector = await SharePointConnector.create_connector(self.logger,
-                                            data_store_provider, config_service)
-            await sharepoint_connector.init()
-            # Override the container's sharepoint_connector provider with the initialized instance
-            self.app_container.sharepoint_connector.override(providers.Object(sharepoint_connector))
-            # Initialize directly since we can't use BackgroundTasks in Kafka consumer
-            return True
-        except Exception as e:
-            self.logger.error("Failed to initialize SharePoint Online connector for org_id %s: %s", org_id, e, exc_info=True)
+        org_id = payload.get("orgId")
+        if not org_id:
+            self.logger.error("'orgId' is required in the payload for 'sharepointonline.init' event.")
             return False
 
+        self.logger.info("Initializing SharePoint Online init sync service for org_id: %s", org_id)
+        config_service = self.app_container.config_service()
+        data_store_provider = ArangoDataStore(self.logger, self.arango_service)
+        data_entities_processor = await get_or_init_data_entities_processor(
+            self.app_container, org_id, Connectors.SHAREPOINT_ONLINE.value, self.logger, data_store_provider, config_service
+        )
+        sharepoint_connector = await SharePointConnector.create_connector(
+            self.logger, data_store_provider, config_service, data_entities_processor
+        )
+        await sharepoint_connector.init()
+        # Override the container's sharepoint_connector provider with the initialized instance
+        self.app_container.sharepoint_connector.override(providers.Object(sharepoint_connector))
+        # Initialize directly since we can't use BackgroundTasks in Kafka consumer
+        return True
+
     async def _handle_sharepoint_start_sync(self, payload: Dict[str, Any]) -> bool:
         """Queue immediate start of the sync service"""
         try:
@@ -77,17 +80,13 @@ class SharePointOnlineEventService(BaseEventService):
             if not org_id:
                 raise ValueError("orgId is required")
 
-            self.logger.info(f"Starting SharePoint Online sync service for org_id: {org_id}")
-            try:
-                sharepoint_connector: SharePointConnector = self.app_container.sharepoint_connector()
-                if sharepoint_connector:
-                    asyncio.create_task(sharepoint_connector.run_sync())
-                    return True
-                else:
-                    self.logger.error("SharePoint Online connector not initialized")
-                    return False
-            except Exception as e:
-                self.logger.error(f"Failed to get SharePoint Online connector: {str(e)}")
+            self.logger.info("Starting SharePoint Online sync service for org_id: %s", org_id)
+            sharepoint_connector: SharePointConnector = self.app_container.sharepoint_connector()
+            if sharepoint_connector:
+                spawn_sync(sharepoint_connector.run_sync())
+                return True
+            else:
+                self.logger.error("SharePoint Online connector not initialized")
                 return False
         except Exception as e:
             self.logger.error("Failed to queue SharePoint Online sync service start: %s", str(e))
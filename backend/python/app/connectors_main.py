@@ -1,15 +1,20 @@
 import asyncio
+import logging
+import os
+import sys
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, List
+from dataclasses import dataclass
+from logging import Logger
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import uvicorn
 from dependency_injector import providers
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
-from app.api.middlewares.auth import authMiddleware
 from app.api.routes.entity import router as entity_router
+from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import AccountType, Connectors
 from app.connectors.api.router import router
 from app.connectors.core.base.data_store.arango_data_store import ArangoDataStore
@@ -21,6 +26,7 @@ from app.connectors.core.registry.connector import (
 from app.connectors.core.registry.connector_registry import (
     ConnectorRegistry,
 )
+from app.connectors.sources.google.common.arango_service import ArangoService
 from app.connectors.sources.localKB.api.kb_router import kb_router
 from app.connectors.sources.microsoft.onedrive.connector import (
     OneDriveConnector,
@@ -30,159 +36,320 @@ from app.connectors.sources.microsoft.sharepoint_online.connector import (
 )
 from app.containers.connector import (
     ConnectorAppContainer,
+    get_or_init_data_entities_processor,
     initialize_container,
     initialize_enterprise_google_account_services_fn,
     initialize_individual_google_account_services_fn,
 )
 from app.services.messaging.kafka.utils.utils import KafkaUtils
 from app.services.messaging.messaging_factory import MessagingFactory
+from app.utils import fast_json
+from app.utils.background_tasks import spawn, spawn_sync
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 container = ConnectorAppContainer.init("connector_service")
 
-async def get_initialized_container() -> ConnectorAppContainer:
-    """Dependency provider for initialized container"""
-    # Create container instance
-    if not hasattr(get_initialized_container, "_initialized"):
-        await initialize_container(container)
-        # Wire the container after initialization
-        container.wire(
-            modules=[
-                "app.core.celery_app",
-                "app.connectors.sources.google.common.sync_tasks",
-                "app.connectors.api.router",
-                "app.connectors.sources.localKB.api.kb_router",
-                "app.api.routes.entity",
-                "app.connectors.api.middleware",
-                "app.core.signed_url",
-            ]
-        )
-        setattr(get_initialized_container, "_initialized", True)
-        # Start token refresh service at app startup
-        try:
-            await startup_service.initialize(container.key_value_store(), await container.arango_service())
-        except Exception as e:
-            container.logger().warning(f"Startup token refresh service failed to initialize: {e}")
+async def initialize_app_container() -> ConnectorAppContainer:
+    """Initialize and wire the container; called once from the lifespan startup"""
+    await initialize_container(container)
+    # Wire the container after initialization
+    container.wire(
+        modules=[
+            "app.core.celery_app",
+            "app.connectors.sources.google.common.sync_tasks",
+            "app.connectors.api.router",
+            "app.connectors.sources.localKB.api.kb_router",
+            "app.api.routes.entity",
+            "app.connectors.api.middleware",
+            "app.core.signed_url",
+        ]
+    )
+    # Start token refresh service at app startup
+    try:
+        await startup_service.initialize(container.key_value_store(), await container.arango_service())
+    except Exception as e:
+        container.logger().warning("Startup token refresh service failed to initialize: %s", e)
     return container
 
 
+# Upper bound on organizations resumed at once, so startup doesn't flood the
+# config service and ArangoDB
+RESUME_ORG_CONCURRENCY = 16
+
+# Google account services override the container-wide drive/gmail providers for
+# one org at a time, so that override and the Drive/Gmail init reading it must
+# not interleave across orgs
+_account_services_lock = asyncio.Lock()
+
+
+# Number of workers draining the initial sync queue, i.e. how many Drive/Gmail
+# initial syncs may run at the same time
+SYNC_WORKERS = int(os.getenv("SYNC_WORKERS", "4"))
+# How long shutdown waits for in-flight initial syncs before cancelling them
+SYNC_WORKERS_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+
+async def _initial_sync_worker(queue: asyncio.Queue, logger: Logger) -> None:
+    """Run queued initial syncs one at a time until a None sentinel is received"""
+    while True:
+        item = await queue.get()
+        try:
+            if item is None:
+                return
+            service, org_id, app_name = item
+            try:
+                await service.perform_initial_sync(org_id)
+            except Exception as e:
+                logger.error("❌ Initial %s sync failed for org %s: %s", app_name, org_id, e)
+        finally:
+            queue.task_done()
+
+
+def start_initial_sync_workers(app_container: ConnectorAppContainer) -> None:
+    """Create the initial sync queue and its fixed pool of workers"""
+    logger = app_container.logger()
+    queue: asyncio.Queue = asyncio.Queue()
+    app_container.initial_sync_queue = queue
+    app_container.initial_sync_workers = [
+        spawn(_initial_sync_worker(queue, logger)) for _ in range(SYNC_WORKERS)
+    ]
+    logger.info("✅ Started %d initial sync workers", SYNC_WORKERS)
+
+
+async def stop_initial_sync_workers(container: ConnectorAppContainer) -> None:
+    """Let the workers finish queued syncs, cancelling whatever outlives the timeout"""
+    logger = container.logger()
+    queue = getattr(container, "initial_sync_queue", None)
+    workers = getattr(container, "initial_sync_workers", [])
+    if queue is None or not workers:
+        return
+
+    # Drop syncs that never started so workers don't begin new full crawls on the
+    # way out; the sentinels then sit right at the front of the queue
+    dropped = 0
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        queue.task_done()
+        dropped += 1
+    if dropped:
+        logger.info("Dropped %d queued initial syncs on shutdown", dropped)
+
+    for _ in workers:
+        queue.put_nowait(None)
+    _, pending = await asyncio.wait(workers, timeout=SYNC_WORKERS_SHUTDOWN_TIMEOUT_SECONDS)
+    for worker in pending:
+        worker.cancel()
+    logger.info("✅ Initial sync workers stopped (%d cancelled)", len(pending))
+    container.initial_sync_workers = []
+
+
+@dataclass
+class _ResumeContext:
+    """Container dependencies resolved once per resume_sync_services call"""
+    app_container: ConnectorAppContainer
+    logger: Logger
+    arango_service: ArangoService
+    config_service: ConfigurationService
+    initial_sync_queue: asyncio.Queue
+
+
+async def _init_drive(org_id: str, ctx: _ResumeContext) -> Any:
+    drive_sync_service = ctx.app_container.drive_sync_service()  # type: ignore
+    await drive_sync_service.initialize(org_id)  # type: ignore
+    ctx.logger.info("Drive Service initialized for org %s", org_id)
+    return drive_sync_service
+
+
+async def _init_gmail(org_id: str, ctx: _ResumeContext) -> Any:
+    gmail_sync_service = ctx.app_container.gmail_sync_service()  # type: ignore
+    await gmail_sync_service.initialize(org_id)  # type: ignore
+    ctx.logger.info("Gmail Service initialized for org %s", org_id)
+    return gmail_sync_service
+
+
+async def _init_onedrive(org_id: str, ctx: _ResumeContext) -> Any:
+    data_store_provider = ArangoDataStore(ctx.logger, ctx.arango_service)
+    data_entities_processor = await get_or_init_data_entities_processor(
+        ctx.app_container, org_id, Connectors.ONEDRIVE.value, ctx.logger, data_store_provider, ctx.config_service
+    )
+    onedrive_connector = await OneDriveConnector.create_connector(
+        ctx.logger, data_store_provider, ctx.config_service, data_entities_processor
+    )
+    await onedrive_connector.init()
+    ctx.app_container.onedrive_connector.override(providers.Object(onedrive_connector))
+    spawn_sync(onedrive_connector.run_sync())
+    ctx.logger.info("OneDrive connector initialized for org %s", org_id)
+    return onedrive_connector
+
+
+async def _init_sharepoint(org_id: str, ctx: _ResumeContext) -> Any:
+    data_store_provider = ArangoDataStore(ctx.logger, ctx.arango_service)
+    data_entities_processor = await get_or_init_data_entities_processor(
+        ctx.app_container, org_id, Connectors.SHAREPOINT_ONLINE.value, ctx.logger, data_store_provider, ctx.config_service
+    )
+    sharepoint_connector = await SharePointConnector.create_connector(
+        ctx.logger, data_store_provider, ctx.config_service, data_entities_processor
+    )
+    await sharepoint_connector.init()
+    ctx.app_container.sharepoint_connector.override(providers.Object(sharepoint_connector))
+    spawn_sync(sharepoint_connector.run_sync())
+    ctx.logger.info("SharePoint connector initialized for org %s", org_id)
+    return sharepoint_connector
+
+
+def _normalize_app_name(name: str) -> str:
+    return name.replace(" ", "").casefold()
+
+
+_DRIVE_APP = _normalize_app_name(Connectors.GOOGLE_DRIVE.value)
+_GMAIL_APP = _normalize_app_name(Connectors.GOOGLE_MAIL.value)
+_GOOGLE_APPS = frozenset((_DRIVE_APP, _GMAIL_APP))
+
+# App initializers used when resuming an org, keyed by normalized app name.
+# None marks apps that are enabled but intentionally not resumed here.
+_RESUME_HANDLERS: Dict[str, Optional[Callable[[str, _ResumeContext], Awaitable[Any]]]] = {
+    _normalize_app_name(Connectors.GOOGLE_CALENDAR.value): None,
+    _DRIVE_APP: _init_drive,
+    _GMAIL_APP: _init_gmail,
+    _normalize_app_name(Connectors.ONEDRIVE.value): _init_onedrive,
+    _normalize_app_name(Connectors.SHAREPOINT_ONLINE.value): _init_sharepoint,
+}
+
+
+async def _run_app_inits(
+    org_id: str, ctx: _ResumeContext, handlers: Dict[str, Callable[[str, _ResumeContext], Awaitable[Any]]]
+) -> Dict[str, Any]:
+    """Run app initializers concurrently and return the services that started"""
+    results = await asyncio.gather(
+        *(handler(org_id, ctx) for handler in handlers.values()), return_exceptions=True
+    )
+    services = {}
+    for name, result in zip(handlers, results):
+        if isinstance(result, Exception):
+            ctx.logger.error("❌ Error initializing %s for org %s: %s", name, org_id, str(result))
+        else:
+            services[name] = result
+    return services
+
+
+async def _resume_org_sync_services(
+    org: dict, ctx: _ResumeContext, semaphore: asyncio.Semaphore
+) -> None:
+    """Initialize the enabled apps of a single organization and kick off its syncs"""
+    app_container = ctx.app_container
+    logger = ctx.logger
+    arango_service = ctx.arango_service
+
+    async with semaphore:
+        org_id = org["_key"]
+        accountType = org.get("accountType", AccountType.INDIVIDUAL.value)
+        if accountType == AccountType.ENTERPRISE.value or accountType == AccountType.BUSINESS.value:
+            initialize_account_services = initialize_enterprise_google_account_services_fn
+        elif accountType == AccountType.INDIVIDUAL.value:
+            initialize_account_services = initialize_individual_google_account_services_fn
+        else:
+            logger.error("Account Type not valid")
+            return
+
+        enabled_apps = await arango_service.get_org_apps(org_id)
+        app_names = [_normalize_app_name(app["name"]) for app in enabled_apps]
+        logger.info("App names: %s", app_names)
+        logger.info(
+            "Processing organization %s with account type %s", org_id, accountType
+        )
+
+        # Get users for this organization
+        users = await arango_service.get_users(org_id, active=True)
+        logger.debug("User: %s", users)
+        if not users:
+            logger.info("No users found for organization %s", org_id)
+            return
+
+        logger.info("Found %d users for organization %s", len(users), org_id)
+
+        google_handlers = {}
+        other_handlers = {}
+        for app_name in app_names:
+            if app_name not in _RESUME_HANDLERS:
+                continue
+            handler = _RESUME_HANDLERS[app_name]
+            if handler is None:
+                logger.info("Skipping %s sync for org %s", app_name, org_id)
+                continue
+            if app_name in _GOOGLE_APPS:
+                google_handlers[app_name] = handler
+            else:
+                other_handlers[app_name] = handler
+
+        async def init_google_apps() -> Dict[str, Any]:
+            async with _account_services_lock:
+                await initialize_account_services(org_id, app_container, app_names)
+                return await _run_app_inits(org_id, ctx, google_handlers)
+
+        # The enabled apps are independent of each other, so initialize them concurrently
+        google_services, _ = await asyncio.gather(
+            init_google_apps(), _run_app_inits(org_id, ctx, other_handlers)
+        )
+        drive_sync_service = google_services.get(_DRIVE_APP)
+        gmail_sync_service = google_services.get(_GMAIL_APP)
+
+        # The initial sync workers pick these up, bounded by SYNC_WORKERS
+        if drive_sync_service is not None:
+            ctx.initial_sync_queue.put_nowait((drive_sync_service, org_id, "drive"))
+            logger.info("✅ Queued Drive sync for org %s", org_id)
+
+        if gmail_sync_service is not None:
+            ctx.initial_sync_queue.put_nowait((gmail_sync_service, org_id, "gmail"))
+            logger.info("✅ Queued Gmail sync for org %s", org_id)
+
+        logger.info("✅ Sync services resumed for org %s", org_id)
+
+
 async def resume_sync_services(app_container: ConnectorAppContainer) -> bool:
     """Resume sync services for users with active sync states"""
     logger = app_container.logger()
     logger.debug("🔄 Checking for sync services to resume")
 
+    tasks: List[asyncio.Task] = []
     try:
         arango_service = await app_container.arango_service()  # type: ignore
 
-        # Get all organizations
-        orgs = await arango_service.get_all_orgs(active=True)
-        if not orgs:
+        ctx = _ResumeContext(
+            app_container=app_container,
+            logger=logger,
+            arango_service=arango_service,
+            config_service=app_container.config_service(),
+            initial_sync_queue=app_container.initial_sync_queue,
+        )
+        # Start resuming each organization as soon as the cursor yields it,
+        # bounded by the semaphore, instead of waiting for the full org list
+        semaphore = asyncio.Semaphore(RESUME_ORG_CONCURRENCY)
+        org_ids: List[str] = []
+        async for org in arango_service.iter_all_orgs(active=True):
+            org_ids.append(org["_key"])
+            tasks.append(spawn(_resume_org_sync_services(org, ctx, semaphore)))
+
+        if not tasks:
             logger.info("No organizations found in the system")
             return True
 
-        logger.info("Found %d organizations in the system", len(orgs))
-        # Process each organization
-        for org in orgs:
-            org_id = org["_key"]
-            accountType = org.get("accountType", AccountType.INDIVIDUAL.value)
-            enabled_apps = await arango_service.get_org_apps(org_id)
-            app_names = [app["name"].replace(" ", "").lower() for app in enabled_apps]
-            logger.info(f"App names: {app_names}")
-            # Ensure the method is called on the correct object
-            if accountType == AccountType.ENTERPRISE.value or accountType == AccountType.BUSINESS.value:
-                await initialize_enterprise_google_account_services_fn(org_id, app_container, app_names)
-            elif accountType == AccountType.INDIVIDUAL.value:
-                await initialize_individual_google_account_services_fn(org_id, app_container, app_names)
-            else:
-                logger.error("Account Type not valid")
-                continue
-
-            logger.info(
-                "Processing organization %s with account type %s", org_id, accountType
-            )
+        logger.info("Found %d organizations in the system", len(tasks))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for org_id, result in zip(org_ids, results):
+            if isinstance(result, Exception):
+                logger.error("❌ Error resuming sync services for org %s: %s", org_id, str(result))
 
-            # Get users for this organization
-            users = await arango_service.get_users(org_id, active=True)
-            logger.info(f"User: {users}")
-            if not users:
-                logger.info("No users found for organization %s", org_id)
-                continue
-
-            logger.info("Found %d users for organization %s", len(users), org_id)
-
-
-            drive_sync_service = None
-            gmail_sync_service = None
-            onedrive_connector = None
-            sharepoint_connector = None
-            for app in enabled_apps:
-                if app["name"].lower() == Connectors.GOOGLE_CALENDAR.value.lower():
-                    logger.info("Skipping calendar sync for org %s", org_id)
-                    continue
-
-                if app["name"].lower() == Connectors.GOOGLE_DRIVE.value.lower():
-                    drive_sync_service = app_container.drive_sync_service()  # type: ignore
-                    await drive_sync_service.initialize(org_id)  # type: ignore
-                    logger.info("Drive Service initialized for org %s", org_id)
-
-                if app["name"].lower() == Connectors.GOOGLE_MAIL.value.lower():
-                    gmail_sync_service = app_container.gmail_sync_service()  # type: ignore
-                    await gmail_sync_service.initialize(org_id)  # type: ignore
-                    logger.info("Gmail Service initialized for org %s", org_id)
-
-                if app["name"].lower() == Connectors.ONEDRIVE.value.lower():
-                    config_service = app_container.config_service()
-                    arango_service = await app_container.arango_service()
-                    data_store_provider = ArangoDataStore(logger, arango_service)
-                    onedrive_connector = await OneDriveConnector.create_connector(logger, data_store_provider, config_service)
-                    await onedrive_connector.init()
-                    app_container.onedrive_connector.override(providers.Object(onedrive_connector))
-                    asyncio.create_task(onedrive_connector.run_sync())
-                    logger.info("OneDrive connector initialized for org %s", org_id)
-
-                if app["name"].lower() == Connectors.SHAREPOINT_ONLINE.value.replace(" ", "").lower():
-                    config_service = app_container.config_service()
-                    arango_service = await app_container.arango_service()
-                    data_store_provider = ArangoDataStore(logger, arango_service)
-
-                    sharepoint_connector = await SharePointConnector.create_connector(logger, data_store_provider, config_service)
-                    await sharepoint_connector.init()
-                    app_container.sharepoint_connector.override(providers.Object(sharepoint_connector))
-                    asyncio.create_task(sharepoint_connector.run_sync())
-                    logger.info("SharePoint connector initialized for org %s", org_id)
-
-            if drive_sync_service is not None:
-                try:
-                    asyncio.create_task(drive_sync_service.perform_initial_sync(org_id))  # type: ignore
-                    logger.info(
-                        "✅ Resumed Drive sync for org %s",
-                        org_id,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "❌ Error resuming Drive sync for org %s: %s",
-                        org_id,
-                        str(e),
-                    )
-
-            if gmail_sync_service is not None:
-                try:
-                    asyncio.create_task(gmail_sync_service.perform_initial_sync(org_id))  # type: ignore
-                    logger.info(
-                        "✅ Resumed Gmail sync for org %s",
-                        org_id,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "❌ Error resuming Gmail sync for org %s: %s",
-                        org_id,
-                        str(e),
-                    )
-
-
-            logger.info("✅ Sync services resumed for org %s", org_id)
         logger.info("✅ Sync services resumed for all orgs")
         return True
+    except asyncio.CancelledError:
+        # Shutdown: org tasks spawned before gather started are not cancelled with it
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
     except Exception as e:
         logger.error("❌ Error during sync service resumption: %s", str(e))
         return False
@@ -201,7 +368,7 @@ async def initialize_connector_registry(app_container: ConnectorAppContainer) ->
         registry.register_connector(OneDriveConnector)
         registry.register_connector(SharePointConnector)
 
-        logger.info(f"Registered {len(registry._connectors)} connectors")
+        logger.info("Registered %d connectors", len(registry._connectors))
 
         # Sync with database
         await registry.sync_with_database()
@@ -210,7 +377,7 @@ async def initialize_connector_registry(app_container: ConnectorAppContainer) ->
         return registry
 
     except Exception as e:
-        logger.error(f"❌ Error initializing connector registry: {str(e)}")
+        logger.error("❌ Error initializing connector registry: %s", e)
         raise
 
 async def start_messaging_producer(app_container: ConnectorAppContainer) -> None:
@@ -236,54 +403,60 @@ async def start_messaging_producer(app_container: ConnectorAppContainer) -> None
         logger.info("✅ Messaging producer started and attached to container")
 
     except Exception as e:
-        logger.error(f"❌ Error starting messaging producer: {str(e)}")
+        logger.error("❌ Error starting messaging producer: %s", e)
         raise
 
-async def start_kafka_consumers(app_container: ConnectorAppContainer) -> List:
-    """Start all Kafka consumers at application level"""
+async def _start_kafka_consumer(
+    app_container: ConnectorAppContainer,
+    name: str,
+    create_config: Callable[[ConnectorAppContainer], Awaitable[Any]],
+    create_handler: Callable[[ConnectorAppContainer], Awaitable[Any]],
+) -> Tuple[str, Any]:
+    """Build and start a single Kafka consumer"""
     logger = app_container.logger()
-    consumers = []
+    logger.info("🚀 Starting %s Kafka Consumer...", name.title())
+    kafka_config, message_handler = await asyncio.gather(
+        create_config(app_container), create_handler(app_container)
+    )
+    kafka_consumer = MessagingFactory.create_consumer(
+        broker_type="kafka",
+        logger=logger,
+        config=kafka_config
+    )
+    await kafka_consumer.start(message_handler)
+    logger.info("✅ %s Kafka consumer started", name.title())
+    return name, kafka_consumer
 
-    try:
-        # 1. Create Entity Consumer
-        logger.info("🚀 Starting Entity Kafka Consumer...")
-        entity_kafka_config = await KafkaUtils.create_entity_kafka_consumer_config(app_container)
-        entity_kafka_consumer = MessagingFactory.create_consumer(
-            broker_type="kafka",
-            logger=logger,
-            config=entity_kafka_config
-        )
-        entity_message_handler = await KafkaUtils.create_entity_message_handler(app_container)
-        await entity_kafka_consumer.start(entity_message_handler)
-        consumers.append(("entity", entity_kafka_consumer))
-        logger.info("✅ Entity Kafka consumer started")
-
-        # 2. Create Sync Consumer
-        logger.info("🚀 Starting Sync Kafka Consumer...")
-        sync_kafka_config = await KafkaUtils.create_sync_kafka_consumer_config(app_container)
-        sync_kafka_consumer = MessagingFactory.create_consumer(
-            broker_type="kafka",
-            logger=logger,
-            config=sync_kafka_config
-        )
-        sync_message_handler = await KafkaUtils.create_sync_message_handler(app_container)
-        await sync_kafka_consumer.start(sync_message_handler)
-        consumers.append(("sync", sync_kafka_consumer))
-        logger.info("✅ Sync Kafka consumer started")
 
-        logger.info(f"✅ All {len(consumers)} Kafka consumers started successfully")
-        return consumers
+async def start_kafka_consumers(app_container: ConnectorAppContainer) -> List:
+    """Start all Kafka consumers at application level"""
+    logger = app_container.logger()
+    consumer_specs = [
+        ("entity", KafkaUtils.create_entity_kafka_consumer_config, KafkaUtils.create_entity_message_handler),
+        ("sync", KafkaUtils.create_sync_kafka_consumer_config, KafkaUtils.create_sync_message_handler),
+    ]
+
+    # Broker metadata fetch and group join are independent per consumer, so overlap them
+    results = await asyncio.gather(
+        *(_start_kafka_consumer(app_container, *spec) for spec in consumer_specs),
+        return_exceptions=True,
+    )
+    consumers = [result for result in results if not isinstance(result, BaseException)]
+    errors = [result for result in results if isinstance(result, BaseException)]
 
-    except Exception as e:
-        logger.error(f"❌ Error starting Kafka consumers: {str(e)}")
+    if errors:
+        logger.error("❌ Error starting Kafka consumers: %s", errors[0])
         # Cleanup any started consumers
         for name, consumer in consumers:
             try:
                 await consumer.stop()
-                logger.info(f"Stopped {name} consumer during cleanup")
+                logger.info("Stopped %s consumer during cleanup", name)
             except Exception as cleanup_error:
-                logger.error(f"Error stopping {name} consumer during cleanup: {cleanup_error}")
-        raise
+                logger.error("Error stopping %s consumer during cleanup: %s", name, cleanup_error)
+        raise errors[0]
+
+    logger.info("✅ All %d Kafka consumers started successfully", len(consumers))
+    return consumers
 
 async def stop_kafka_consumers(container: ConnectorAppContainer) -> None:
     """Stop all Kafka consumers"""
@@ -293,9 +466,9 @@ async def stop_kafka_consumers(container: ConnectorAppContainer) -> None:
     for name, consumer in consumers:
         try:
             await consumer.stop()
-            logger.info(f"✅ {name.title()} Kafka consumer stopped")
+            logger.info("✅ %s Kafka consumer stopped", name.title())
         except Exception as e:
-            logger.error(f"❌ Error stopping {name} consumer: {str(e)}")
+            logger.error("❌ Error stopping %s consumer: %s", name, e)
 
     # Clear the consumers list
     if hasattr(container, 'kafka_consumers'):
@@ -314,7 +487,21 @@ async def stop_messaging_producer(container: ConnectorAppContainer) -> None:
         else:
             logger.info("No messaging producer to stop")
     except Exception as e:
-        logger.error(f"❌ Error stopping messaging producer: {str(e)}")
+        logger.error("❌ Error stopping messaging producer: %s", e)
+
+async def stop_resume_sync_services(container: ConnectorAppContainer) -> None:
+    """Cancel a still-running resume so it stops enqueuing work during shutdown"""
+    resume_task = getattr(container, "resume_sync_task", None)
+    if resume_task is None or resume_task.done():
+        return
+
+    resume_task.cancel()
+    try:
+        await resume_task
+    except asyncio.CancelledError:
+        pass
+    container.logger().info("✅ Cancelled in-progress sync service resumption")
+
 
 async def shutdown_container_resources(container: ConnectorAppContainer) -> None:
     """Shutdown all container resources properly"""
@@ -324,6 +511,12 @@ async def shutdown_container_resources(container: ConnectorAppContainer) -> None
         # Stop Kafka consumers
         await stop_kafka_consumers(container)
 
+        # Stop resuming orgs before the workers, so nothing is enqueued after they exit
+        await stop_resume_sync_services(container)
+
+        # Stop initial sync workers
+        await stop_initial_sync_workers(container)
+
         # Stop messaging producer
         await stop_messaging_producer(container)
 
@@ -331,18 +524,18 @@ async def shutdown_container_resources(container: ConnectorAppContainer) -> None
         try:
             await startup_service.shutdown()
         except Exception as e:
-            logger.warning(f"Error shutting down startup services: {e}")
+            logger.warning("Error shutting down startup services: %s", e)
 
         logger.info("✅ All container resources shut down successfully")
 
     except Exception as e:
-        logger.error(f"❌ Error during container resource shutdown: {str(e)}")
+        logger.error("❌ Error during container resource shutdown: %s", e)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI"""
-    # Initialize container
-    app_container = await get_initialized_container()
+    # Initialize container before any other startup work
+    app_container = await initialize_app_container()
     app.container = app_container  # type: ignore
 
     app.state.config_service = app_container.config_service()
@@ -361,7 +554,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await start_messaging_producer(app_container)
         logger.info("✅ Messaging producer started successfully")
     except Exception as e:
-        logger.error(f"❌ Failed to start messaging producer: {str(e)}")
+        logger.error("❌ Failed to start messaging producer: %s", e)
         raise
 
     # Start all Kafka consumers centrally
@@ -370,11 +563,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app_container.kafka_consumers = consumers
         logger.info("✅ All Kafka consumers started successfully")
     except Exception as e:
-        logger.error(f"❌ Failed to start Kafka consumers: {str(e)}")
+        logger.error("❌ Failed to start Kafka consumers: %s", e)
         raise
 
     # Resume sync services
-    asyncio.create_task(resume_sync_services(app_container))
+    start_initial_sync_workers(app_container)
+    app_container.resume_sync_task = spawn(resume_sync_services(app_container))
 
     yield
     logger.info("🔄 Shut down application started")
@@ -382,7 +576,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     try:
         await shutdown_container_resources(app_container)
     except Exception as e:
-        logger.error(f"❌ Error during application shutdown: {str(e)}")
+        logger.error("❌ Error during application shutdown: %s", e)
 
 
 # Create FastAPI app with lifespan
@@ -391,46 +585,8 @@ app = FastAPI(
     description="Service for syncing Google Drive content to ArangoDB",
     version="1.0.0",
     lifespan=lifespan,
-    dependencies=[Depends(get_initialized_container)],
 )
 
-# List of paths to apply authentication to
-INCLUDE_PATHS = ["/api/v1/stream/record/", "/api/v1/delete/", "/api/v1/entity/", "/api/v1/connectors/"]
-
-@app.middleware("http")
-async def authenticate_requests(request: Request, call_next)-> JSONResponse:
-    logger = app.container.logger()  # type: ignore
-    logger.info(f"Middleware request: {request.url.path}")
-
-    # Check if path should be excluded from authentication (OAuth callbacks)
-    if "/oauth/callback" in request.url.path:
-        # Skip authentication for OAuth callbacks
-        return await call_next(request)
-
-    # Apply middleware only to specific paths
-    if not any(request.url.path.startswith(path) for path in INCLUDE_PATHS):
-        # Skip authentication for other paths
-        return await call_next(request)
-
-    try:
-        # Apply authentication
-        authenticated_request = await authMiddleware(request)
-        # Continue with the request
-        logger.info("Call Next")
-        response = await call_next(authenticated_request)
-        return response
-
-    except HTTPException as exc:
-        # Handle authentication errors
-        return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
-    except Exception:
-        # Handle unexpected errors
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"},
-        )
-
-
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -441,16 +597,20 @@ app.add_middleware(
 )
 
 
+@router.get("/healthz")
+async def liveness_check() -> Response:
+    """Liveness probe endpoint"""
+    return Response(content=b"ok", media_type="text/plain")
+
+
 @router.get("/health")
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """Basic health check endpoint"""
     try:
-        return JSONResponse(
+        return Response(
+            content=fast_json.dumps({"status": "healthy", "timestamp": get_epoch_timestamp_in_ms()}),
             status_code=200,
-            content={
-                "status": "healthy",
-                "timestamp": get_epoch_timestamp_in_ms(),
-            },
+            media_type="application/json",
         )
     except Exception as e:
         return JSONResponse(
@@ -474,10 +634,12 @@ app.include_router(router)
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger = app.container.logger()  # type: ignore
-    logger.error("Global error: %s", str(exc), exc_info=True)
+    message = str(exc)
+    # Formatting tracebacks is costly during error bursts, so only do it when debugging
+    logger.error("Global error: %s", message, exc_info=logger.isEnabledFor(logging.DEBUG))
     return JSONResponse(
         status_code=500,
-        content={"status": "error", "message": str(exc), "path": request.url.path},
+        content={"status": "error", "message": message, "path": request.url.path},
     )
 
 
@@ -490,6 +652,9 @@ def run(host: str = "0.0.0.0", port: int = 8088, workers: int = 1, reload: bool
         log_level="info",
         reload=reload,
         workers=workers,
+        # uvloop does not support Windows, fall back to the default asyncio loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
 import google.oauth2.credentials
@@ -8,6 +9,10 @@ from google.oauth2 import service_account
 from app.config.configuration_service import ConfigurationService
 from app.config.constants.arangodb import AppGroups
 from app.config.providers.etcd.etcd3_encrypted_store import Etcd3EncryptedKeyValueStore
+from app.connectors.core.base.data_processor.data_source_entities_processor import (
+    DataSourceEntitiesProcessor,
+)
+from app.connectors.core.base.data_store.data_store import DataStoreProvider
 from app.connectors.services.kafka_service import KafkaService
 from app.connectors.sources.google.admin.admin_webhook_handler import (
     AdminWebhookHandler,
@@ -632,6 +637,26 @@ async def cache_google_workspace_service_credentials(org_id, arango_service, log
         logger.error(f"Error initializing service credentials cache: {str(e)}")
         raise
 
+async def get_or_init_data_entities_processor(
+    container, org_id: str, app_name: str, logger, data_store_provider: DataStoreProvider,
+    config_service: ConfigurationService
+) -> DataSourceEntitiesProcessor:
+    """Return the initialized entities processor for (org_id, app_name), creating it on first use."""
+    if not hasattr(container, 'data_entities_processors'):
+        container.data_entities_processors = {}
+        container.data_entities_processor_locks = defaultdict(asyncio.Lock)
+
+    cache_key = (org_id, app_name)
+    # Per-key lock so back-to-back init events don't initialize the same processor twice
+    async with container.data_entities_processor_locks[cache_key]:
+        data_entities_processor = container.data_entities_processors.get(cache_key)
+        if data_entities_processor is None:
+            data_entities_processor = DataSourceEntitiesProcessor(logger, data_store_provider, config_service)
+            await data_entities_processor.initialize()
+            container.data_entities_processors[cache_key] = data_entities_processor
+            logger.info("Initialized data entities processor for org %s, app %s", org_id, app_name)
+        return data_entities_processor
+
 async def refresh_google_workspace_user_credentials(org_id, arango_service, logger, container,app_name: str) -> None:
     """Background task to refresh user credentials before they expire"""
     logger.debug("🔄 Checking refresh status of credentials for user")
@@ -50,7 +50,7 @@ class DocumentExtraction(Transformer):
 
     async def apply(self, ctx: TransformContext) -> None:
         record = ctx.record
-        blocks = record.block_containers.blocks
+        blocks = record.ensure_blocks().blocks
         document_classification = await self.process_document(blocks, record.org_id)
         record.semantic_metadata = SemanticMetadata(
             departments=document_classification.departments,
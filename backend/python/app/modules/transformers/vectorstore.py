@@ -79,7 +79,7 @@ class VectorStore(Transformer):
         record = ctx.record
         record_id = record.id
         virtual_record_id = record.virtual_record_id
-        block_containers = record.block_containers
+        block_containers = record.ensure_blocks()
         org_id = record.org_id
 
         await self.index_documents(block_containers, org_id,record_id,virtual_record_id)
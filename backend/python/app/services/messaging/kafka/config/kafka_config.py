@@ -18,3 +18,6 @@ class KafkaConsumerConfig:
     auto_offset_reset: str
     enable_auto_commit: bool
     bootstrap_servers: List[str]
+    # Poll up to batch_size records, waiting at most batch_period_ms for them
+    batch_size: int = 1
+    batch_period_ms: int = 1000
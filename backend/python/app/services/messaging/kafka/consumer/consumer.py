@@ -1,5 +1,4 @@
 import asyncio
-import json
 from logging import Logger
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
@@ -8,6 +7,7 @@ from aiokafka import AIOKafkaConsumer, TopicPartition  # type: ignore
 from app.services.messaging.interface.consumer import IMessagingConsumer
 from app.services.messaging.kafka.config.kafka_config import KafkaConsumerConfig
 from app.services.messaging.kafka.rate_limiter.rate_limiter import RateLimiter
+from app.utils import fast_json
 
 # Concurrency control settings
 MAX_CONCURRENT_TASKS = 5  # Maximum number of messages to process concurrently
@@ -138,22 +138,19 @@ class KafkaMessagingConsumer(IMessagingConsumer):
             parsed_message = None
 
             try:
-                if isinstance(message_value, bytes):
-                    message_value = message_value.decode("utf-8")
-                    self.logger.debug(f"Decoded bytes message for {message_id}")
-
-                if isinstance(message_value, str):
+                # Bytes are parsed directly, without an intermediate str decode
+                if isinstance(message_value, (bytes, str)):
                     try:
-                        parsed_message = json.loads(message_value)
+                        parsed_message = fast_json.loads(message_value)
                         # Handle double-encoded JSON
                         if isinstance(parsed_message, str):
-                            parsed_message = json.loads(parsed_message)
+                            parsed_message = fast_json.loads(parsed_message)
                             self.logger.debug("Handled double-encoded JSON message")
 
                         self.logger.debug(
                             f"Parsed message {message_id}: type={type(parsed_message)}"
                         )
-                    except json.JSONDecodeError as e:
+                    except fast_json.JSONDecodeError as e:
                         self.logger.error(
                             f"JSON parsing failed for message {message_id}: {str(e)}\n"
                             f"Raw message: {message_value[:1000]}..."
@@ -196,42 +193,64 @@ class KafkaMessagingConsumer(IMessagingConsumer):
             if message_id:
                 self.__mark_message_processed(message_id)
 
+    async def __process_partition_batch(self, messages: List) -> Optional[int]:
+        """Process one partition's messages in order and return the offset to commit"""
+        next_offset = None
+        for message in messages:
+            try:
+                self.logger.info(f"Received message: topic={message.topic}, partition={message.partition}, offset={message.offset}")
+                success = await self.__process_message(message)
+                if success:
+                    next_offset = message.offset + 1
+                else:
+                    self.logger.warning(f"Failed to process message at offset {message.offset}")
+            except Exception as e:
+                self.logger.error(f"Error processing individual message: {e}")
+        return next_offset
+
     async def __consume_loop(self) -> None:
         """Main consumption loop"""
         try:
             self.logger.info("Starting Kafka consumer loop")
             while self.running:
                 try:
-                    # Get messages asynchronously with timeout
-                    message_batch = await self.consumer.getmany(timeout_ms=1000, max_records=1) # type: ignore
+                    # Get a batch of messages asynchronously with timeout
+                    message_batch = await self.consumer.getmany( # type: ignore
+                        timeout_ms=self.kafka_config.batch_period_ms,
+                        max_records=self.kafka_config.batch_size,
+                    )
 
                     if not message_batch:
                         await asyncio.sleep(0.1)
                         continue
 
-                    # Process messages from all topic partitions
-                    for topic_partition, messages in message_batch.items():
-                        for message in messages:
-                            try:
-                                self.logger.info(f"Received message: topic={message.topic}, partition={message.partition}, offset={message.offset}")
-                                # TODO: Remove this not needed
-                                if self.rate_limiter:
+                    # TODO: Remove this not needed
+                    if self.rate_limiter:
+                        for topic_partition, messages in message_batch.items():
+                            for message in messages:
+                                try:
+                                    self.logger.info(f"Received message: topic={message.topic}, partition={message.partition}, offset={message.offset}")
                                     await self.__start_processing_task(message, topic_partition)
-                                else:
-                                    success = await self.__process_message(message)
-                                    if success:
-                                        # Commit the offset for this message
-                                        # Tells Kafka that this message has been successfully processed
-                                        await self.consumer.commit({topic_partition: message.offset + 1}) # type: ignore
-                                        self.logger.info(
-                                            f"Committed offset for topic-partition {message.topic}-{message.partition} at offset {message.offset}"
-                                        )
-                                    else:
-                                        self.logger.warning(f"Failed to process message at offset {message.offset}")
-
-                            except Exception as e:
-                                self.logger.error(f"Error processing individual message: {e}")
-                                continue
+                                except Exception as e:
+                                    self.logger.error(f"Error processing individual message: {e}")
+                        continue
+
+                    # Ordering only matters within a partition, so partitions are processed
+                    # concurrently and each is committed once for the whole batch
+                    topic_partitions = list(message_batch.keys())
+                    next_offsets = await asyncio.gather(
+                        *(self.__process_partition_batch(message_batch[tp]) for tp in topic_partitions)
+                    )
+                    offsets_to_commit = {
+                        tp: offset for tp, offset in zip(topic_partitions, next_offsets) if offset is not None
+                    }
+                    if offsets_to_commit:
+                        # Tells Kafka that these messages have been successfully processed
+                        await self.consumer.commit(offsets_to_commit) # type: ignore
+                        for tp, offset in offsets_to_commit.items():
+                            self.logger.info(
+                                f"Committed offset for topic-partition {tp.topic}-{tp.partition} at offset {offset - 1}"
+                            )
 
                 except asyncio.CancelledError:
                     self.logger.info("Kafka consumer task cancelled")
@@ -1,4 +1,3 @@
-import json
 from logging import Logger
 from typing import Any, Dict, List, Optional
 
@@ -6,6 +5,7 @@ from aiokafka import AIOKafkaProducer  # type: ignore
 
 from app.services.messaging.interface.producer import IMessagingProducer
 from app.services.messaging.kafka.config.kafka_config import KafkaProducerConfig
+from app.utils import fast_json
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
@@ -80,7 +80,7 @@ class KafkaMessagingProducer(IMessagingProducer):
             if self.producer is None:
                 await self.initialize()
 
-            message_value = json.dumps(message).encode('utf-8')
+            message_value = fast_json.dumps(message)
             message_key = key.encode('utf-8') if key else None
 
             record_metadata = await self.producer.send_and_wait( # type: ignore
@@ -23,6 +23,10 @@ from app.services.messaging.kafka.handlers.ai_config import AiConfigEventService
 from app.services.messaging.kafka.handlers.entity import EntityEventService
 from app.services.messaging.kafka.handlers.record import RecordEventHandler
 
+# Entity events are small and independent, so poll them in batches
+ENTITY_CONSUMER_BATCH_SIZE = 20
+ENTITY_CONSUMER_BATCH_PERIOD_MS = 500
+
 
 class KafkaUtils:
     @staticmethod
@@ -30,7 +34,9 @@ class KafkaUtils:
     app_container: Union[ConnectorAppContainer, IndexingAppContainer, QueryAppContainer],
     client_id: str,
     group_id: str,
-    topics: List[str]
+    topics: List[str],
+    batch_size: int = 1,
+    batch_period_ms: int = 1000,
 ) -> KafkaConsumerConfig:
         """Create a base Kafka consumer configuration."""
         config_service = app_container.config_service()
@@ -50,7 +56,9 @@ class KafkaUtils:
             auto_offset_reset='earliest',
             enable_auto_commit=True,
             bootstrap_servers=brokers,
-            topics=topics
+            topics=topics,
+            batch_size=batch_size,
+            batch_period_ms=batch_period_ms,
         )
 
     @staticmethod
@@ -71,7 +79,14 @@ class KafkaUtils:
     @staticmethod
     async def create_entity_kafka_consumer_config(app_container: ConnectorAppContainer) -> KafkaConsumerConfig:
         """Create Kafka configuration for entity events"""
-        return await KafkaUtils._create_base_consumer_config(app_container, "entity_consumer_client", "entity_consumer_group", ["entity-events"])
+        return await KafkaUtils._create_base_consumer_config(
+            app_container,
+            "entity_consumer_client",
+            "entity_consumer_group",
+            ["entity-events"],
+            batch_size=ENTITY_CONSUMER_BATCH_SIZE,
+            batch_period_ms=ENTITY_CONSUMER_BATCH_PERIOD_MS,
+        )
 
 
     @staticmethod
@@ -11,15 +11,17 @@ from app.config.providers.etcd.etcd3_encrypted_store import Etcd3EncryptedKeyVal
 from app.config.configuration_service import ConfigurationService
 from app.sources.external.google.forms.forms import GoogleFormsDataSource
 
+logger = logging.getLogger(__name__)
+
 
 async def main() -> None:
     # create configuration service client
-    etcd3_encrypted_key_value_store = Etcd3EncryptedKeyValueStore(logger=logging.getLogger(__name__))
+    etcd3_encrypted_key_value_store = Etcd3EncryptedKeyValueStore(logger=logger)
 
     # create configuration service
-    config_service = ConfigurationService(logger=logging.getLogger(__name__), key_value_store=etcd3_encrypted_key_value_store)
+    config_service = ConfigurationService(logger=logger, key_value_store=etcd3_encrypted_key_value_store)
     # create graph db service
-    graph_db_service = await GraphDBFactory.create_service("arango", logger=logging.getLogger(__name__), config_service=config_service)
+    graph_db_service = await GraphDBFactory.create_service("arango", logger=logger, config_service=config_service)
     if not graph_db_service:
         raise RuntimeError("Graph DB service not found")
     await graph_db_service.connect()
@@ -28,7 +30,7 @@ async def main() -> None:
     enterprise_google_client = await GoogleClient.build_from_services(
         service_name="forms",
         version="v1",
-        logger=logging.getLogger(__name__),
+        logger=logger,
         config_service=config_service,
         graph_db_service=graph_db_service,
         scopes=[
@@ -0,0 +1,29 @@
+import asyncio
+import os
+from typing import Any, Coroutine, Set
+
+# Upper bound on long-running connector syncs executing at the same time
+SYNC_MAX_CONCURRENCY = int(os.getenv("SYNC_MAX_CONCURRENCY", "8"))
+
+# The event loop only keeps weak references to tasks, so fire-and-forget tasks
+# are held here until they finish to avoid being garbage collected mid-run
+_background_tasks: Set[asyncio.Task] = set()
+_sync_semaphore = asyncio.Semaphore(SYNC_MAX_CONCURRENCY)
+
+
+def spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule a coroutine in the background and keep a reference until it is done"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _run_bounded(coro: Coroutine[Any, Any, Any]) -> Any:
+    async with _sync_semaphore:
+        return await coro
+
+
+def spawn_sync(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule a connector sync in the background, bounded by SYNC_MAX_CONCURRENCY"""
+    return spawn(_run_bounded(coro))
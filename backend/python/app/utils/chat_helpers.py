@@ -56,7 +56,7 @@ async def get_flattened_results(result_set: List[Dict[str, Any]], blob_store: Bl
         record = virtual_record_id_to_result[virtual_record_id]
         if record is None:
             continue
-        block_container = record.get("block_containers",{})
+        block_container = record.get("block_containers") or {}
         blocks = block_container.get("blocks",[])
         block_groups = block_container.get("block_groups",[])
 
@@ -153,7 +153,7 @@ async def get_flattened_results(result_set: List[Dict[str, Any]], blob_store: Bl
         record = virtual_record_id_to_result[virtual_record_id]
         if record is None:
             continue
-        block_container = record.get("block_containers",{})
+        block_container = record.get("block_containers") or {}
         blocks = block_container.get("blocks",[])
         block_groups = block_container.get("block_groups",[])
         block_group = block_groups[block_group_index]
@@ -200,7 +200,7 @@ async def get_flattened_results(result_set: List[Dict[str, Any]], blob_store: Bl
             record = virtual_record_id_to_result[virtual_record_id]
             if record is None:
                 continue
-            blocks  = record.get("block_containers",{}).get("blocks",[])
+            blocks  = (record.get("block_containers") or {}).get("blocks",[])
             if index < len(blocks) and index >= 0:
                 block = blocks[index]
                 block_type = block.get("type")
@@ -240,7 +240,7 @@ async def get_flattened_results(result_set: List[Dict[str, Any]], blob_store: Bl
         record = virtual_record_id_to_result[virtual_record_id]
         if record is None:
             continue
-        block_container = record.get("block_containers",{})
+        block_container = record.get("block_containers") or {}
         blocks = block_container.get("blocks",[])
         block_groups = block_container.get("block_groups",[])
 